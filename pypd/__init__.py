@@ -6,6 +6,6 @@ from .integrator import EulerCromer
 from .boundary_conditions import BoundaryConditions
 from .material import Material
 from .constitutive_law import Linear, Bilinear, Trilinear, NonLinear
-from .penetrator import Penetrator
+from .penetrator import Penetrator, PenetratorSet
 from .simulation_data import Observation
 from .animation import Animation
@@ -1,12 +1,55 @@
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
-import copy
+import io
+import multiprocessing
+
+import numpy as np
 import matplotlib.pyplot as plt
 import matplotlib.animation as animation
+from matplotlib.figure import Figure
+from PIL import Image
+
+
+def _render_frame(frame, i_frame, sz, show_title, xlim, ylim, clim):
+    """
+    Render a single cached frame to PNG bytes. Module-level (rather than a
+    method) so it can be pickled into ProcessPoolExecutor workers, and
+    built on Figure directly (rather than pyplot) so worker processes need
+    no GUI backend.
+    """
+    fig = Figure()
+    ax = fig.add_subplot()
+    ax.set_facecolor((1, 1, 1, 0))
+    fig.patch.set_alpha(0)
+    ax.set_xlim(xlim)
+    ax.set_ylim(ylim)
+    ax.set_aspect("equal")
+    ax.axis("off")
+
+    scatter = ax.scatter(frame["xy"][:, 0], frame["xy"][:, 1], s=sz, c=frame["c"], cmap="jet")
+    scatter.set_clim(clim)
+
+    if show_title:
+        ax.set_title(f"frame {i_frame}")
+
+    fig.tight_layout()
+    buffer = io.BytesIO()
+    fig.savefig(buffer, format="png", dpi=300)
+    return buffer.getvalue()
 
 
 class Animation:
     def __init__(
-        self, frequency=100, name=None, sz=1, dsf=0, show_title=True, data="damage"
+        self,
+        frequency=100,
+        name=None,
+        sz=1,
+        dsf=0,
+        show_title=True,
+        data="damage",
+        n_workers=None,
+        stream=False,
+        memmap_path=None,
     ):
         """
         Initialise the Animation object
@@ -28,20 +71,57 @@ class Animation:
 
         show_title : bool, optional
             If True, displays the title with the frame number. Default is True.
+
+        n_workers : int, optional
+            Number of worker processes used to render frames in parallel
+            when generating the animation. Frames are independent, so
+            rendering scales with the number of physical cores. The worker
+            processes are started with the spawn method, so the calling
+            script must be import-safe (guard it with
+            if __name__ == "__main__"). Each worker pays a one-off import
+            cost at startup, so parallel rendering only pays for long
+            simulations with many (or large) frames. Default is None
+            (render serially in-process).
+
+        stream : bool, optional
+            If True, each frame is drawn and handed straight to the movie
+            writer as the simulation runs, so memory use is O(1) in the
+            number of frames rather than O(frames). Axis limits and the
+            colour scale are set per frame (the full history is never
+            held). Default is False.
+
+        memmap_path : str, optional
+            If provided, cached frames are spilled to this file on disk and
+            read back through a memory map when the animation is generated,
+            so long runs do not hold every frame in RAM. Default is None
+            (frames are cached in memory).
         """
         self.frequency = frequency
         self.name = name or self._generate_animation_name()
         self.sz = sz
         self.dsf = dsf
+        self.n_workers = n_workers
+        self.stream = stream
+        self.memmap_path = memmap_path
         self.frames = []
         self.show_title = show_title
         self.data = data
         self.fig, self.ax = plt.subplots()
+        self.scatter = None
+        self.writer = None
+        self._n_streamed = 0
+        self._memmap_file = None
+        self._n_spilled = 0
+        self._n_nodes = None
 
         if self.data not in ["damage", "strain energy density"]:
             raise ValueError(
                 f"Unsupported data type '{self.data}'. Use 'damage' or 'strain energy density'."
             )
+        if self.stream and self.n_workers is not None:
+            raise ValueError("stream and n_workers are mutually exclusive")
+        if self.stream and self.memmap_path is not None:
+            raise ValueError("stream and memmap_path are mutually exclusive")
 
     @staticmethod
     def _generate_animation_name():
@@ -50,14 +130,82 @@ class Animation:
 
     def save_frame(self, particles, bonds):
         """
-        Append a matplotlib.figure.Figure object to the self.frames list at a
-        frequency defined by self.frequency
+        Append the current particle state to the self.frames list at a
+        frequency defined by self.frequency. Only plain arrays (displaced
+        particle positions and the colour-mapped data) are cached - building
+        and deep copying a Figure per frame is orders of magnitude slower
+        and more memory hungry. Arrays are stored as float32 - plenty for
+        plotting, and half the cache footprint. In streaming mode the
+        frame is written to disk immediately and nothing is cached; with
+        memmap_path set, frames are spilled to disk instead of RAM.
+        """
+        if self.stream:
+            return self._stream_frame(particles, bonds)
+
+        xy = (particles.x + (particles.u * self.dsf)).astype(np.float32)
+        c = self._compute_data(particles, bonds).astype(np.float32)
+
+        if self.memmap_path is not None:
+            return self._spill_frame(xy, c)
+
+        self.frames.append({"xy": xy, "c": c})
+
+    def _spill_frame(self, xy, c):
         """
-        fig = plt.figure(figsize=(12, 6))
-        particles.plot(
-            fig, sz=self.sz, dsf=self.dsf, data=self._compute_data(particles, bonds)
+        Append a frame (xy then c, float32) to the spill file on disk
+        """
+        if self._memmap_file is None:
+            self._memmap_file = open(self.memmap_path, "wb")
+            self._n_nodes = len(c)
+        self._memmap_file.write(xy.tobytes())
+        self._memmap_file.write(c.tobytes())
+        self._n_spilled += 1
+
+    def _load_spilled_frames(self):
+        """
+        Map the spill file back into the self.frames list. The frame
+        arrays are views into a read-only memory map, so frames are paged
+        in on demand rather than loaded into RAM
+        """
+        self._memmap_file.close()
+        self._memmap_file = None
+
+        n = self._n_nodes
+        spilled = np.memmap(
+            self.memmap_path,
+            dtype=np.float32,
+            mode="r",
+            shape=(self._n_spilled, 3 * n),
+        )
+        self.frames = [
+            {"xy": row[: 2 * n].reshape(n, 2), "c": row[2 * n :]} for row in spilled
+        ]
+
+    def _stream_frame(self, particles, bonds):
+        """
+        Draw the current particle state into the figure and hand it
+        straight to the movie writer. The writer is set up lazily on the
+        first frame and finished by generate_animation
+        """
+        if self.writer is None:
+            self.writer = self._select_writer()
+            self.writer.setup(self.fig, self.name, dpi=300)
+
+        xy = particles.x + (particles.u * self.dsf)
+        self.ax.cla()
+        self.ax.set_facecolor((1, 1, 1, 0))
+        self.ax.set_aspect("equal")
+        self.ax.axis("off")
+        self.ax.scatter(
+            xy[:, 0], xy[:, 1], s=self.sz, c=self._compute_data(particles, bonds),
+            cmap="jet",
         )
-        self.frames.append(copy.deepcopy(fig))
+
+        if self.show_title:
+            self.ax.set_title(f"frame {self._n_streamed}")
+
+        self.writer.grab_frame()
+        self._n_streamed += 1
 
     def _compute_data(self, particles, bonds):
         """
@@ -70,20 +218,32 @@ class Animation:
             particles.compute_strain_energy_density(bonds)
             return particles.W
 
-    def _set_axis_limits(self, i):
-        x_data, y_data = self._get_data_from_frame(i)
-        self.ax.set_xlim(min(x_data), max(x_data))
-        self.ax.set_ylim(min(y_data), max(y_data))
+    def _plot_limits(self):
+        """
+        Compute the axis limits and colour scale covering all cached frames
+        """
+        xy = np.concatenate([frame["xy"] for frame in self.frames])
+        xlim = (xy[:, 0].min(), xy[:, 0].max())
+        ylim = (xy[:, 1].min(), xy[:, 1].max())
+        clim = (0, max(frame["c"].max() for frame in self.frames))
+        return xlim, ylim, clim
 
-    def _get_data_from_frame(self, i):
-        return self.frames[i].get_axes()[0].collections[0].get_offsets().T
+    def _initialise_plot(self):
+        """
+        Create the single scatter artist that is reused for every frame in
+        the animation
+        """
+        xlim, ylim, clim = self._plot_limits()
+        self.ax.set_facecolor((1, 1, 1, 0))
+        self.fig.patch.set_alpha(0)
+        self.ax.set_xlim(xlim)
+        self.ax.set_ylim(ylim)
+        self.ax.set_aspect("equal")
+        self.ax.axis("off")
 
-    def _set_scatter_data(self, current_scatter):
-        scatter = self.ax.scatter([], [], s=[], c=[], cmap="jet")
-        scatter.set_offsets(current_scatter.get_offsets())
-        scatter.set_sizes(current_scatter.get_sizes())
-        scatter.set_array(current_scatter.get_array())
-        return scatter
+        self.scatter = self.ax.scatter([], [], s=self.sz, c=[], cmap="jet")
+        self.scatter.set_clim(clim)
+        self.fig.tight_layout()
 
     def _update(self, frame):
         """
@@ -93,31 +253,82 @@ class Animation:
         -----
         Required signature: `def func(frame, *fargs) -> iterable_of_artists`
         """
-        self.ax.clear()
-        self.ax.set_facecolor((1, 1, 1, 0))
-        self.fig.patch.set_alpha(0)
-        current_scatter = self.frames[frame].get_axes()[0].collections[0]
-        self._set_axis_limits(frame)
-        scatter = self._set_scatter_data(current_scatter)
+        self.scatter.set_offsets(self.frames[frame]["xy"])
+        self.scatter.set_array(self.frames[frame]["c"])
 
         if self.show_title:
             self.ax.set_title(f"frame {frame}")
 
-        self.ax.set_aspect("equal")
-        self.ax.axis("off")
-        self.fig.tight_layout()
-        return scatter
+        return (self.scatter,)
+
+    def _select_writer(self):
+        """
+        Select a writer based on the file extension of self.name (pillow is
+        always available as a matplotlib dependency; ffmpeg must be
+        installed separately)
+        """
+        if self.name.endswith(".gif"):
+            return animation.PillowWriter(fps=10)
+        return animation.FFMpegWriter()
 
     def generate_animation(self):
         """
-        Generate an animation from the saved frames (matplotlib.figure.Figure
-        objects)
+        Generate an animation from the saved frames (cached particle
+        positions and colour-mapped data). In streaming mode the frames
+        are already on disk and the writer is simply finished. If
+        self.n_workers is set, frames are rendered in a process pool and
+        stitched into a gif; otherwise the animation is rendered serially
+        in-process.
 
         Parameters
         ----------
         None
         """
+        if self.stream:
+            if self.writer is not None:
+                self.writer.finish()
+                self.writer = None
+            return
+        if self.memmap_path is not None and self._memmap_file is not None:
+            self._load_spilled_frames()
+        if self.n_workers is not None:
+            return self._generate_animation_parallel()
+
+        self._initialise_plot()
+        # blit=False - saved animations redraw the full figure per frame
+        # regardless, and blitting corrupts gif output (stale background)
         self.ani = animation.FuncAnimation(
             self.fig, self._update, frames=len(self.frames), interval=100, blit=False
         )
-        self.ani.save(self.name, writer=animation.FFMpegWriter(), dpi=300)
+        self.ani.save(self.name, writer=self._select_writer(), dpi=300)
+
+    def _generate_animation_parallel(self):
+        """
+        Render one PNG per frame in a pool of worker processes (the frames
+        are independent) and stitch the results, in order, into a gif
+        """
+        if not self.name.endswith(".gif"):
+            raise ValueError("Parallel rendering only supports gif output")
+
+        xlim, ylim, clim = self._plot_limits()
+        # spawn (not fork) - after a numba parallel kernel has run, forked
+        # workers inherit the parent's threading state and deadlock at exit
+        context = multiprocessing.get_context("spawn")
+        with ProcessPoolExecutor(
+            max_workers=self.n_workers, mp_context=context
+        ) as executor:
+            futures = [
+                executor.submit(
+                    _render_frame, frame, i, self.sz, self.show_title, xlim, ylim, clim
+                )
+                for i, frame in enumerate(self.frames)
+            ]
+            images = [Image.open(io.BytesIO(future.result())) for future in futures]
+
+        images[0].save(
+            self.name,
+            save_all=True,
+            append_images=images[1:],
+            duration=100,
+            loop=0,
+        )
@@ -5,7 +5,9 @@ Bond array class
 
 import numpy as np
 
-from .kernels.bonds import build_bond_list, build_bond_length
+from .kernels.bonds import build_bond_list
+from .kernels.constitutive_law import calculate_bond_damage
+from .tools import pairwise_norm
 
 
 class BondSet:
@@ -131,7 +133,7 @@ class BondSet:
         xi : ndarray (float)
             Reference bond length
         """
-        return build_bond_length(x, self.bondlist)
+        return pairwise_norm(x[self.bondlist[:, 1]] - x[self.bondlist[:, 0]])
 
     def _calculate_surface_correction_factors(self, particles):
         """
@@ -142,7 +144,7 @@ class BondSet:
         of Peridynamic Modeling. Chapman and Hall/CRC, New York, 1st edition.
         """
         surface_correction_factors = np.ones(self.n_bonds)
-        v0 = np.pi * particles.horizon**2
+        v0 = np.pi * particles.horizon2
 
         for k_bond in range(self.n_bonds):
             node_i = self.bondlist[k_bond, 0]
@@ -186,17 +188,14 @@ class BondSet:
         """
         pass
 
-    def calculate_bond_damage(self):
+    def calculate_bond_damage(self, stretch):
         """
-        Calculate bond damage (softening parameter)
+        Calculate bond damage (softening parameter) for all bonds
 
         Parameters
         ----------
-        d : ndarray (float)
-            Bond damage (softening parameter). The value of d will range from 0
-            to 1, where 0 indicates that the bond is still in the elastic range,
-            and 1 represents a bond that has failed
-
+        stretch : ndarray (float)
+            Bond stretch (dimensionless)
 
         Returns
         -------
@@ -207,8 +206,12 @@ class BondSet:
 
         Notes
         -----
-        * User must select or define a constitutive law (linear / bilinear /
-        trilinear / non-linear)
-        * from solver.constitutive_model import trilinear
+        * The constitutive law (linear / bilinear / trilinear / non-linear)
+        is selected when the bond set is constructed
+        * The bonds are evaluated in parallel and the existing damage array
+        (self.d) is updated in place - no allocation occurs per call
         """
-        pass
+        calculate_bond_damage(
+            stretch, self.d, self.constitutive_law.calculate_bond_damage
+        )
+        return self.d
@@ -7,10 +7,14 @@ Notes
 
 """
 
-import numpy as np
-from numba import njit
+import math
 
-from .kernels.constitutive_law import linear, trilinear, nonlinear
+from .kernels.constitutive_law import (
+    make_linear_law,
+    make_trilinear_law,
+    make_nonlinear_law,
+    make_no_damage_law,
+)
 
 
 class ConstitutiveLaw:
@@ -45,7 +49,7 @@ class ConstitutiveLaw:
         -----
         TODO: this function is generic to all material models
         """
-        return (9 * material.E) / (np.pi * self.t * particles.horizon**3)
+        return (9 * material.E) / (math.pi * self.t * particles.horizon3)
 
     def required_parameters():
         """
@@ -114,8 +118,10 @@ class Linear(ConstitutiveLaw):
         should be improved
         """
         self.t = t
-        self.c = c or self._calculate_bond_stiffness(material, particles)
-        self.sc = sc or self._calculate_sc(material, particles)
+        # Explicit None checks - `c or ...` would silently recompute the
+        # default when a user legitimately passes 0.0
+        self.c = self._calculate_bond_stiffness(material, particles) if c is None else c
+        self.sc = self._calculate_sc(material, particles) if sc is None else sc
         self.damage_on = damage_on
         self.calculate_bond_damage = self._calculate_bond_damage(
             self.sc, self.damage_on
@@ -136,7 +142,9 @@ class Linear(ConstitutiveLaw):
         -----
 
         """
-        return np.sqrt((4 * np.pi * material.Gf) / (9 * material.E * particles.horizon))
+        return math.sqrt(
+            (4 * math.pi * material.Gf) / (9 * material.E * particles.horizon)
+        )
 
     @staticmethod
     def _calculate_bond_damage(sc, damage_on):
@@ -156,53 +164,13 @@ class Linear(ConstitutiveLaw):
 
         Notes
         -----
+        * Compiled wrappers are cached by parameter value (see
+        kernels.constitutive_law), so instances with identical parameters
+        share a single compiled function
         """
         if damage_on:
-
-            @njit
-            def wrapper(stretch, d):
-                """
-                Calculate bond damage
-
-                Parameters
-                ----------
-                stretch : float
-                    Bond stretch
-
-                d : float
-                    Bond damage (softening parameter) at time t. The value of d
-                    will range from 0 to 1, where 0 indicates that the bond is
-                    still in the elastic range, and 1 represents a bond that has
-                    failed
-
-                Returns
-                -------
-                d : float
-                    Bond damage (softening parameter) at time t+1. The value of d
-                    will range from 0 to 1, where 0 indicates that the bond is
-                    still in the elastic range, and 1 represents a bond that has
-                    failed
-
-                Notes
-                -----
-                * Examine closures and factory functions
-                """
-                return linear(stretch, d, sc)
-
-        else:
-
-            @njit
-            def wrapper(stretch, d):
-                """
-                Returns
-                -------
-                d: float
-                    An array of zeros with the same size as the input array `d`,
-                    indicating no bond damage.
-                """
-                return np.zeros_like(d)
-
-        return wrapper
+            return make_linear_law(sc)
+        return make_no_damage_law()
 
     def calculate_nodal_forces(self):
         """
@@ -264,9 +232,9 @@ class Trilinear(ConstitutiveLaw):
         self.t = t
         self.beta = beta
         self.gamma = self._calculate_gamma()
-        self.c = c or self._calculate_bond_stiffness(material, particles)
-        self.s0 = s0 or self._calculate_s0(material)
-        self.sc = sc or self._calculate_sc(material, particles)
+        self.c = self._calculate_bond_stiffness(material, particles) if c is None else c
+        self.s0 = self._calculate_s0(material) if s0 is None else s0
+        self.sc = self._calculate_sc(material, particles) if sc is None else sc
         self.s1 = self._calculate_s1()
         self.calculate_bond_damage = self._calculate_bond_damage(
             self.s0, self.s1, self.sc, self.beta
@@ -285,7 +253,7 @@ class Trilinear(ConstitutiveLaw):
         numerator = 4 * self.gamma * material.Gf
         denominator = (
             self.t
-            * particles.horizon**4
+            * particles.horizon4
             * self.c
             * self.s0
             * (1 + (self.gamma * self.beta))
@@ -323,39 +291,11 @@ class Trilinear(ConstitutiveLaw):
 
         Notes
         -----
+        * Compiled wrappers are cached by parameter value (see
+        kernels.constitutive_law), so instances with identical parameters
+        share a single compiled function
         """
-
-        @njit
-        def wrapper(stretch, d):
-            """
-            Calculate bond damage
-
-            Parameters
-            ----------
-            stretch : float
-                Bond stretch
-
-            d : float
-                Bond damage (softening parameter) at time t. The value of d
-                will range from 0 to 1, where 0 indicates that the bond is
-                still in the elastic range, and 1 represents a bond that has
-                failed
-
-            Returns
-            -------
-            d : float
-                Bond damage (softening parameter) at time t+1. The value of d
-                will range from 0 to 1, where 0 indicates that the bond is
-                still in the elastic range, and 1 represents a bond that has
-                failed
-
-            Notes
-            -----
-            * Examine closures and factory functions
-            """
-            return trilinear(stretch, d, s0, s1, sc, beta)
-
-        return wrapper
+        return make_trilinear_law(s0, s1, sc, beta)
 
     def print_parameters(self):
         """
@@ -407,9 +347,9 @@ class NonLinear(ConstitutiveLaw):
         self.t = t
         self.alpha = alpha
         self.k = k
-        self.c = c or self._calculate_bond_stiffness(material, particles)
-        self.s0 = s0 or self._calculate_s0(material)
-        self.sc = sc or self._calculate_sc(material, particles)
+        self.c = self._calculate_bond_stiffness(material, particles) if c is None else c
+        self.s0 = self._calculate_s0(material) if s0 is None else s0
+        self.sc = self._calculate_sc(material, particles) if sc is None else sc
         self.calculate_bond_damage = self._calculate_bond_damage(
             self.s0, self.sc, self.alpha, self.k
         )
@@ -423,30 +363,24 @@ class NonLinear(ConstitutiveLaw):
     def _calculate_sc(self, material, particles):
         """
         Nonlinear model (2D case) - calculate the critical stretch
-        """
-        numerator_a = 4 * self.k * (1 - np.exp(self.k)) * (1 + self.alpha)
-        numerator_b = (
-            self.t
-            * self.c
-            * particles.horizon**4
-            * self.s0**2
-            * (
-                (2 * self.k)
-                - (2 * np.exp(self.k))
-                + (self.alpha * self.k)
-                - (self.alpha * self.k * np.exp(self.k) + 2)
-            )
-        ) / ((4 * self.k) + (np.exp(self.k) - 1) * (1 + self.alpha))
-        numerator = numerator_a * (material.Gf - numerator_b)
-        denominator_a = self.t * self.c * particles.horizon**4 * self.s0
-        denominator_b = (
-            (2 * self.k)
-            - (2 * np.exp(self.k))
-            + (self.alpha * self.k)
-            - (self.alpha * self.k * np.exp(self.k))
-            + 2
+
+        Notes
+        -----
+        All terms are scalar, so the exponential is computed once with
+        math.exp rather than repeatedly dispatching through np.exp
+        """
+        alpha = self.alpha
+        k = self.k
+        e_k = math.exp(k)
+        horizon_4 = particles.horizon4
+
+        bracket = (2 * k) - (2 * e_k) + (alpha * k) - (alpha * k * e_k) + 2
+        numerator_a = 4 * k * (1 - e_k) * (1 + alpha)
+        numerator_b = (self.t * self.c * horizon_4 * self.s0**2 * bracket) / (
+            (4 * k) + (e_k - 1) * (1 + alpha)
         )
-        denominator = denominator_a * denominator_b
+        numerator = numerator_a * (material.Gf - numerator_b)
+        denominator = self.t * self.c * horizon_4 * self.s0 * bracket
         return numerator / denominator
 
     @staticmethod
@@ -476,39 +410,11 @@ class NonLinear(ConstitutiveLaw):
 
         Notes
         -----
+        * Compiled wrappers are cached by parameter value (see
+        kernels.constitutive_law), so instances with identical parameters
+        share a single compiled function
         """
-
-        @njit
-        def wrapper(stretch, d):
-            """
-            Calculate bond damage
-
-            Parameters
-            ----------
-            stretch : float
-                Bond stretch
-
-            d : float
-                Bond damage (softening parameter) at time t. The value of d
-                will range from 0 to 1, where 0 indicates that the bond is
-                still in the elastic range, and 1 represents a bond that has
-                failed
-
-            Returns
-            -------
-            d : float
-                Bond damage (softening parameter) at time t+1. The value of d
-                will range from 0 to 1, where 0 indicates that the bond is
-                still in the elastic range, and 1 represents a bond that has
-                failed
-
-            Notes
-            -----
-            * Examine closures and factory functions
-            """
-            return nonlinear(stretch, d, s0, sc, alpha, k)
-
-        return wrapper
+        return make_nonlinear_law(s0, sc, alpha, k)
 
     def print_parameters(self):
         """
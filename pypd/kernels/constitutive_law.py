@@ -5,11 +5,11 @@ Small, highly optimised computational units written using Numba
 
 """
 
-from numba import njit
+from numba import njit, prange
 import numpy as np
 
 
-@njit
+@njit(cache=True, fastmath=True)
 def linear(s, d, sc):
     """
     Linear constitutive model
@@ -30,7 +30,7 @@ def linear(s, d, sc):
     return d
 
 
-@njit
+@njit(cache=True, fastmath=True)
 def trilinear(s, d, s0, s1, sc, beta):
     """
     Trilinear constitutive model
@@ -55,7 +55,7 @@ def trilinear(s, d, s0, s1, sc, beta):
     return d
 
 
-@njit
+@njit(cache=True, fastmath=True)
 def nonlinear(s, d, s0, sc, alpha, k):
     """
     Non-linear constitutive model
@@ -77,3 +77,115 @@ def nonlinear(s, d, s0, sc, alpha, k):
         d = d_temp
 
     return d
+
+
+@njit(parallel=True, fastmath=True, cache=True)
+def calculate_bond_damage(stretch, d, material_law):
+    """
+    Evaluate the bond damage for all bonds. The bonds are independent
+    (each reads one stretch and one damage scalar), so the loop is
+    embarrassingly parallel. d is an out-parameter - the existing damage
+    buffer is updated in place and nothing is allocated or returned.
+
+    Parameters
+    ----------
+    stretch : ndarray (float)
+        Bond stretch
+
+    d : ndarray (float)
+        Bond damage (softening parameter). The value of d will range from
+        0 to 1, where 0 indicates that the bond is still in the elastic
+        range, and 1 represents a bond that has failed
+
+    material_law : function
+        Compiled bond damage function with the call statement
+        material_law(stretch, d)
+    """
+    n_bonds = len(stretch)
+
+    for k_bond in prange(n_bonds):
+        d[k_bond] = material_law(stretch[k_bond], d[k_bond])
+
+
+# Compiled bond damage functions, keyed by (model, parameters). Each
+# constitutive law constructor requests a wrapper specialised to its
+# parameter values; identical parameter sets (e.g. parameter sweeps that
+# instantiate thousands of models) reuse the same compiled closure rather
+# than triggering a fresh numba compile per instance.
+_wrapper_cache = {}
+
+
+def _cached_wrapper(key, factory):
+    if key not in _wrapper_cache:
+        _wrapper_cache[key] = factory()
+    return _wrapper_cache[key]
+
+
+def make_linear_law(sc):
+    """
+    Build a compiled bond damage function - linear model - with the call
+    statement wrapper(stretch, d)
+    """
+
+    def factory():
+        @njit(fastmath=True)
+        def wrapper(stretch, d):
+            return linear(stretch, d, sc)
+
+        return wrapper
+
+    return _cached_wrapper(("linear", float(sc)), factory)
+
+
+def make_trilinear_law(s0, s1, sc, beta):
+    """
+    Build a compiled bond damage function - trilinear model - with the call
+    statement wrapper(stretch, d)
+    """
+
+    def factory():
+        @njit(fastmath=True)
+        def wrapper(stretch, d):
+            return trilinear(stretch, d, s0, s1, sc, beta)
+
+        return wrapper
+
+    return _cached_wrapper(
+        ("trilinear", float(s0), float(s1), float(sc), float(beta)), factory
+    )
+
+
+def make_nonlinear_law(s0, sc, alpha, k):
+    """
+    Build a compiled bond damage function - non-linear model - with the call
+    statement wrapper(stretch, d)
+    """
+
+    def factory():
+        @njit(fastmath=True)
+        def wrapper(stretch, d):
+            return nonlinear(stretch, d, s0, sc, alpha, k)
+
+        return wrapper
+
+    return _cached_wrapper(
+        ("nonlinear", float(s0), float(sc), float(alpha), float(k)), factory
+    )
+
+
+def make_no_damage_law():
+    """
+    Build a compiled bond damage function that leaves all bonds undamaged
+    (damage_on=False). Returns a plain zero rather than allocating a zeros
+    array - the wrapper is called once per bond on the hottest loop and
+    must be allocation-free.
+    """
+
+    def factory():
+        @njit(fastmath=True)
+        def wrapper(stretch, d):
+            return 0.0
+
+        return wrapper
+
+    return _cached_wrapper(("no damage",), factory)
@@ -6,7 +6,7 @@ import numpy as np
 from numba import njit, prange
 
 
-@njit(parallel=True)
+@njit(parallel=True, cache=True)
 def euler_cromer(
     node_force,
     u,
@@ -7,7 +7,7 @@ import sklearn.neighbors as neighbors
 from numba import njit, prange
 
 
-@njit(parallel=True, fastmath=True)
+@njit(parallel=True, fastmath=True, cache=True)
 def compute_nodal_forces(
     x,
     u,
@@ -99,7 +99,7 @@ def compute_nodal_forces(
     return node_force, d
 
 
-@njit
+@njit(cache=True)
 def compute_node_damage(x, bondlist, d, n_family_members):
     """
     Compute the nodal damage
@@ -145,7 +145,7 @@ def compute_node_damage(x, bondlist, d, n_family_members):
     return node_damage
 
 
-@njit(parallel=True, fastmath=True)
+@njit(parallel=True, fastmath=True, cache=True)
 def compute_strain_energy_density(x, u, cell_volume, bondlist, d, c):
     """
     Compute strain energy density - employs bondlist
@@ -209,7 +209,7 @@ def compute_strain_energy_density(x, u, cell_volume, bondlist, d, c):
     return W
 
 
-def build_particle_families(x, horizon):
+def build_particle_families(x, horizon, tree=None):
     """
     Build particle families
 
@@ -221,6 +221,10 @@ def build_particle_families(x, horizon):
     horizon : float
         Material point horizon (non-local length scale)
 
+    tree : sklearn.neighbors.KDTree, optional
+        Spatial index of the particle coordinates. If not provided, a new
+        tree is built.
+
     Returns
     -------
     nlist : list of numpy arrays (int)
@@ -233,7 +237,8 @@ def build_particle_families(x, horizon):
     """
     n_nodes = np.shape(x)[0]
 
-    tree = neighbors.KDTree(x, leaf_size=160)
+    if tree is None:
+        tree = neighbors.KDTree(x, leaf_size=160)
     neighbour_list = tree.query_radius(x, r=horizon)
 
     # Remove identity values, as there is no bond between a node and itself
@@ -3,10 +3,10 @@ Small, highly optimised computational units written using Numba
 """
 
 import numpy as np
-from numba import njit
+from numba import njit, prange
 
 
-@njit
+@njit(parallel=True, cache=True)
 def calculate_contact_force(
     penetrator_family,
     penetrator_radius,
@@ -27,12 +27,6 @@ def calculate_contact_force(
 
     Returns
     -------
-    u : ndarray
-        Updated displacement array
-
-    v : ndarray
-        Updated velocity array
-
     contact_force : ndarray
         Resultant force components
 
@@ -41,40 +35,121 @@ def calculate_contact_force(
     - 'C style' code
     - Based on code from rigid_impactor.f90 in Chapter 10 - Peridynamic Theory
     & its Applications by Madenci & Oterkus
+    - Family nodes are independent (each is touched once), so the previous
+    displacement and velocity are read scalar-wise before being
+    overwritten - no O(N) copies of u and v are made - and the family is
+    iterated in parallel. Squared distances are compared against the
+    squared radius so no square root is computed for nodes outside the
+    penetrator.
     """
 
     n_nodes = len(penetrator_family)
-    n_dimensions = np.shape(x)[1]
-    u_previous = u.copy()
-    v_previous = v.copy()
+    radius_sq = penetrator_radius * penetrator_radius
+    contact_force_x = 0.0
+    contact_force_y = 0.0
 
-    distance_component = np.zeros(n_dimensions, np.float64)
-    contact_force = np.zeros(n_dimensions, np.float64)
-    unit_vector = np.zeros(n_dimensions, np.float64)
-    unit_vector_scaled = np.zeros(n_dimensions, np.float64)
-    a = np.zeros(n_dimensions, np.float64)
-
-    for i in range(n_nodes):
+    for i in prange(n_nodes):
         node = penetrator_family[i]
-        for j in range(n_dimensions):
-            distance_component[j] = (x[node, j] + u[node, j]) - penetrator_position[j]
+        component_x = (x[node, 0] + u[node, 0]) - penetrator_position[0]
+        component_y = (x[node, 1] + u[node, 1]) - penetrator_position[1]
+        distance_sq = (component_x * component_x) + (component_y * component_y)
+
+        if distance_sq < radius_sq:
+            distance = np.sqrt(distance_sq)
+
+            unit_vector_scaled_x = (component_x / distance) * penetrator_radius
+            u_previous = u[node, 0]
+            v_previous = v[node, 0]
+            u[node, 0] = (penetrator_position[0] + unit_vector_scaled_x) - x[node, 0]
+            v[node, 0] = (u[node, 0] - u_previous) / dt
+            contact_force_x += density * cell_volume * ((v[node, 0] - v_previous) / dt)
+
+            unit_vector_scaled_y = (component_y / distance) * penetrator_radius
+            u_previous = u[node, 1]
+            v_previous = v[node, 1]
+            u[node, 1] = (penetrator_position[1] + unit_vector_scaled_y) - x[node, 1]
+            v[node, 1] = (u[node, 1] - u_previous) / dt
+            contact_force_y += density * cell_volume * ((v[node, 1] - v_previous) / dt)
+
+    return np.array([contact_force_x, contact_force_y])
+
+
+@njit(parallel=True, cache=True)
+def calculate_contact_force_all(
+    family_start,
+    family_idx,
+    penetrator_radii,
+    penetrator_positions,
+    x,
+    u,
+    v,
+    density,
+    cell_volume,
+    dt,
+    contact_force,
+):
+    """
+    Calculate the contact force between every rigid penetrator and the
+    deformable peridynamic body in a single pass. The penetrator families
+    are stored in a CSR-style layout (the family of penetrator p is
+    family_idx[family_start[p]:family_start[p + 1]]) and the penetrators
+    are iterated in parallel.
 
-        distance = np.sqrt(np.sum(distance_component**2))
+    Parameters
+    ----------
+    family_start : ndarray (int)
+        Index into family_idx of the first family member of each
+        penetrator
 
-        if distance < penetrator_radius:
-            for j in range(n_dimensions):
-                unit_vector[j] = distance_component[j] / distance
-                unit_vector_scaled[j] = unit_vector[j] * penetrator_radius
+    family_idx : ndarray (int)
+        Concatenated penetrator families
+
+    penetrator_radii : ndarray (float)
 
-                u[node, j] = (penetrator_position[j] + unit_vector_scaled[j]) - x[
-                    node, j
-                ]
-                v[node, j] = (u[node, j] - u_previous[node, j]) / dt
-                a[j] = (v[node, j] - v_previous[node, j]) / dt
+    penetrator_positions : ndarray (float)
+        Position of every penetrator at the current time step
 
-                contact_force[j] = contact_force[j] + (density * cell_volume * a[j])
+    contact_force : ndarray (float)
+        Out-parameter - resultant force components per penetrator,
+        zeroed by the caller
 
-    return contact_force
+    Notes
+    -----
+    - Penetrator families are assumed to be disjoint (two penetrators do
+    not contact the same particle in the same time step)
+    """
+    n_penetrators = len(penetrator_radii)
+    n_dimensions = np.shape(x)[1]
+
+    for p in prange(n_penetrators):
+        radius = penetrator_radii[p]
+
+        for k in range(family_start[p], family_start[p + 1]):
+            node = family_idx[k]
+
+            distance_sq = 0.0
+            for j in range(n_dimensions):
+                component = (x[node, j] + u[node, j]) - penetrator_positions[p, j]
+                distance_sq += component * component
+
+            if distance_sq < radius * radius:
+                distance = np.sqrt(distance_sq)
+
+                for j in range(n_dimensions):
+                    component = (
+                        x[node, j] + u[node, j]
+                    ) - penetrator_positions[p, j]
+                    unit_vector_scaled = (component / distance) * radius
+
+                    u_previous = u[node, j]
+                    v_previous = v[node, j]
+                    u[node, j] = (
+                        penetrator_positions[p, j] + unit_vector_scaled
+                    ) - x[node, j]
+                    v[node, j] = (u[node, j] - u_previous) / dt
+                    a = (v[node, j] - v_previous) / dt
+
+                    contact_force[p, j] += density * cell_volume * a
 
 
 def calculate_contact_force_vectorised(
@@ -8,6 +8,8 @@ TODO: rename classes as base or baseclasses?
 from tqdm import trange
 import matplotlib.pyplot as plt
 
+from .penetrator import PenetratorSet
+
 
 class Model:
     """
@@ -52,8 +54,10 @@ class Model:
 
         constitutive_law : ConstitutiveLaw class
 
-        penetrators: list
-            List of penetrator objects/instances
+        penetrators: list or PenetratorSet
+            List of penetrator objects/instances, or a PenetratorSet (the
+            contact force for all penetrators is then computed by a single
+            kernel per time step)
 
         Returns
         -------
@@ -96,10 +100,15 @@ class Model:
         self.particles.update_positions(self.simulation, self.integrator, i_time_step)
 
         if self.penetrators:
-            for penetrator in self.penetrators:
-                penetrator.calculate_penetrator_force(
+            if isinstance(self.penetrators, PenetratorSet):
+                self.penetrators.calculate_penetrator_force(
                     self.particles, self.simulation, i_time_step
                 )
+            else:
+                for penetrator in self.penetrators:
+                    penetrator.calculate_penetrator_force(
+                        self.particles, self.simulation, i_time_step
+                    )
 
         if self.animation:
             if i_time_step % self.animation.frequency == 0:
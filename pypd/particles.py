@@ -6,7 +6,9 @@ TODO: rename classes as base or baseclasses?
 """
 
 import numpy as np
+import sklearn.neighbors as neighbors
 
+from .neighbors import UniformGrid
 from .tools import smooth_step_data
 from .kernels.particles import (
     build_particle_families,
@@ -39,9 +41,22 @@ class ParticleSet:
     n_family_members: ndarray (int)
         Array specifying the number of family members for each particle
 
+    tree : sklearn.neighbors.KDTree
+        Spatial index of the particle coordinates in the reference
+        configuration. Built once at setup and shared by all neighbour
+        searches (particle families, penetrator families...)
+
+    grid : UniformGrid
+        Uniform grid (cell list) spatial index with cell size equal to the
+        horizon. Faster than the tree for fixed-radius point queries.
+
     x : ndarray (float)
         Material point coordinates in the reference configuration
 
+    x32 : ndarray (float32)
+        Contiguous single precision copy of x used by memory-bound
+        neighbour search kernels (grid queries)
+
     u : ndarray (float)
         Displacement array
 
@@ -117,12 +132,27 @@ class ParticleSet:
 
         self.dx = dx  # TODO: this should not be an attribute of the particle set. Perhaps a Mesh class is required?
         self.horizon = m * dx  # TODO: is this an attribute of the particle set?
+        # Powers of the horizon recur across the constitutive and contact
+        # code (bond stiffness, critical stretch, surface correction...) -
+        # compute them once
+        self.horizon2 = self.horizon**2
+        self.horizon3 = self.horizon**3
+        self.horizon4 = self.horizon**4
         self.cell_area = dx**2
         self.cell_volume = dx**3
 
         self.material = material
         self.node_density = self.material.density
 
+        # Neighbour searches are memory bound (they touch every particle
+        # coordinate once) and easily tolerate single precision - a
+        # contiguous float32 copy of the reference coordinates halves the
+        # cache footprint of the grid queries. Forces and displacements
+        # remain float64.
+        self.x32 = np.ascontiguousarray(self.x, dtype=np.float32)
+        self.tree = neighbors.KDTree(self.x, leaf_size=160)
+        self.grid = UniformGrid(self.x32, self.horizon)
+
         self.nlist = nlist
         if self.nlist is None:
             self.nlist, self.n_family_members = self._build_particle_families()
@@ -155,7 +185,7 @@ class ParticleSet:
         Notes
         -----
         """
-        return build_particle_families(self.x, self.horizon)
+        return build_particle_families(self.x, self.horizon, self.tree)
 
     def compute_forces(self, bonds, material_law):
         """
@@ -3,7 +3,7 @@ import itertools
 import matplotlib.pyplot as plt
 
 from .tools import smooth_step_data
-from .kernels.penetrator import calculate_contact_force
+from .kernels.penetrator import calculate_contact_force, calculate_contact_force_all
 
 # TODO: should Penetrator be a base class? Create a subclass for supports
 
@@ -29,32 +29,46 @@ class Penetrator:
         self.magnitude = magnitude
         self.radius = radius
         self.search_radius = radius * 1.25
+        self.search_radius_sq = self.search_radius**2
         self.family = self._build_family(particles)
+        self.trajectory = None
         self.name = name
         if plot:
             self.plot_penetrator(particles)
         self.penetrator_force_history = []
 
     def _build_family(self, particles):
-        family = []
-        for i in range(particles.n_nodes):
-            distance = np.sqrt(np.sum((particles.x[i] - self.centre) ** 2))
-            if distance <= self.search_radius:
-                family.append(i)
-
-        return np.array(family)
+        """
+        Build the penetrator family - indices of all particles that lie
+        within the search radius of the penetrator centre. Queries the
+        uniform grid built at particle set construction, visiting only the
+        cells overlapped by the search radius (O(k) rather than a O(N)
+        sweep over all particles).
+        """
+        return particles.grid.query(self.centre, self.search_radius)
 
-    def update_penetrator_position(self, i_time_step, n_time_steps):
+    def _build_trajectory(self, n_time_steps):
         """
-        Update the penetrator position
+        Precompute the penetrator position at every time step. The smooth
+        step displacement profile depends only on the time step index, so
+        the full trajectory is evaluated once (vectorised) rather than
+        re-evaluating the polynomial inside the time loop.
         """
+        profile = smooth_step_data(np.arange(n_time_steps), 0, n_time_steps, 0.0, 1.0)
         return self.centre + (
-            self.unit_vector
-            * smooth_step_data(
-                i_time_step, 0, n_time_steps, np.array([0, 0]), self.magnitude
-            )
+            self.unit_vector * (self.magnitude * profile[:, None])
         )
 
+    def update_penetrator_position(self, i_time_step, n_time_steps):
+        """
+        Update the penetrator position - indexes the precomputed trajectory
+        (built lazily on the first call)
+        """
+        if self.trajectory is None or len(self.trajectory) != n_time_steps:
+            self.trajectory = self._build_trajectory(n_time_steps)
+
+        return self.trajectory[i_time_step]
+
     def calculate_penetrator_force(self, particles, simulation, i_time_step):
         """
         Calculate the contact force between a rigid penetrator and deformable
@@ -105,3 +119,125 @@ class Penetrator:
         ax.scatter(particles.x[self.family, 0], particles.x[self.family, 1])
         plt.title(self.name)
         plt.show()
+
+
+class PenetratorSet:
+    """
+    Structure-of-arrays container for a collection of penetrators (and
+    supports). The centres, radii and families of all penetrators are
+    stored in parallel arrays so that the contact force for the whole
+    collection is computed by a single numba kernel per time step, rather
+    than dispatching into Python once per penetrator. The individual
+    Penetrator objects remain thin views (plotting, force history...).
+
+    Attributes
+    ----------
+    penetrators : list
+        The wrapped Penetrator instances
+
+    radii : ndarray (float)
+
+    search_radii : ndarray (float)
+
+    centres : ndarray (float)
+        Penetrator centres at t=0
+
+    family_start : ndarray (int)
+        Index into family_idx of the first family member of each
+        penetrator (CSR-style layout)
+
+    family_idx : ndarray (int)
+        Concatenated penetrator families
+
+    Notes
+    -----
+    - Penetrator families are assumed to be disjoint
+    """
+
+    def __init__(self, penetrators, particles):
+        """
+        PenetratorSet class constructor
+
+        Parameters
+        ----------
+        penetrators : list
+            List of penetrator objects/instances
+
+        particles : ParticleSet
+        """
+        self.penetrators = list(penetrators)
+        self.radii = np.array([p.radius for p in self.penetrators], dtype=np.float64)
+        self.search_radii = np.array(
+            [p.search_radius for p in self.penetrators], dtype=np.float64
+        )
+        self.centres = np.array(
+            [np.asarray(p.centre, dtype=np.float64) for p in self.penetrators]
+        )
+        self.family_start, self.family_idx = self._build_families(particles)
+
+        n_dim = particles.n_dim
+        self._positions = np.zeros((len(self.penetrators), n_dim))
+        self._contact_force = np.zeros((len(self.penetrators), n_dim))
+
+    def __len__(self):
+        return len(self.penetrators)
+
+    def __iter__(self):
+        return iter(self.penetrators)
+
+    def _build_families(self, particles):
+        """
+        Build the families of all penetrators with a single batched query
+        of the particle spatial index - one amortised traversal for all
+        centres, rather than one descent per penetrator - and pack them
+        into a CSR-style layout (family_start / family_idx). Each
+        penetrator can have its own search radius.
+        """
+        if self.penetrators:
+            families = particles.tree.query_radius(self.centres, r=self.search_radii)
+            families = [np.sort(family).astype(np.int64) for family in families]
+        else:
+            families = []
+        family_start = np.zeros(len(families) + 1, dtype=np.int64)
+        family_start[1:] = np.cumsum([len(family) for family in families])
+        if families:
+            family_idx = np.concatenate(families)
+        else:
+            family_idx = np.zeros(0, dtype=np.int64)
+        return family_start, family_idx
+
+    def calculate_penetrator_force(self, particles, simulation, i_time_step):
+        """
+        Calculate the contact force between every penetrator and the
+        deformable peridynamic body with a single kernel invocation
+
+        Parameters
+        ----------
+        particles : ParticleSet
+
+        simulation : Simulation class
+
+        i_time_step : int
+        """
+        for i, penetrator in enumerate(self.penetrators):
+            self._positions[i] = penetrator.update_penetrator_position(
+                i_time_step, simulation.n_time_steps
+            )
+
+        self._contact_force[:] = 0.0
+        calculate_contact_force_all(
+            self.family_start,
+            self.family_idx,
+            self.radii,
+            self._positions,
+            particles.x,
+            particles.u,
+            particles.v,
+            particles.material.density,
+            particles.cell_volume,
+            simulation.dt,
+            self._contact_force,
+        )
+
+        for i, penetrator in enumerate(self.penetrators):
+            penetrator.penetrator_force_history.append(self._contact_force[i].copy())
@@ -2,7 +2,7 @@ import numpy as np
 from numba import njit
 
 
-@njit
+@njit(cache=True)
 def smooth_step_data(
     current_time_step, start_time_step, final_time_step, start_value, final_value
 ):
@@ -17,6 +17,38 @@ def smooth_step_data(
     return alpha
 
 
+def pairwise_norm(d):
+    """
+    Row-wise Euclidean norm of an (n, n_dim) array of difference vectors
+
+    Parameters
+    ----------
+    d : ndarray (float)
+        Array of difference vectors, e.g. x - centre
+
+    Returns
+    -------
+    ndarray (float)
+        The Euclidean norm of every row
+
+    Notes
+    -----
+    The einsum formulation is considerably faster than
+    np.linalg.norm(d, axis=1). For distance comparisons prefer
+    pairwise_norm_sq - comparing squared distances against a squared
+    radius avoids the square root entirely.
+    """
+    return np.sqrt(np.einsum("ij,ij->i", d, d))
+
+
+def pairwise_norm_sq(d):
+    """
+    Row-wise squared Euclidean norm of an (n, n_dim) array of difference
+    vectors (see pairwise_norm)
+    """
+    return np.einsum("ij,ij->i", d, d)
+
+
 def calculate_stable_time_step(rho, dx, horizon, c):
     """
     Calculate minimum stable time step
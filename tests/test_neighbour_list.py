@@ -0,0 +1,57 @@
+import numpy as np
+
+from pypd.neighbors import UniformGrid
+
+
+def build_particle_coordinates(dx, n_div_x, n_div_y):
+    particle_coordinates = np.zeros([n_div_x * n_div_y, 2])
+    counter = 0
+
+    for i_y in range(n_div_y):
+        for i_x in range(n_div_x):
+            coord_x = dx * i_x
+            coord_y = dx * i_y
+            particle_coordinates[counter, 0] = coord_x
+            particle_coordinates[counter, 1] = coord_y
+            counter += 1
+
+    return particle_coordinates
+
+
+def brute_force_query(x, centre, radius):
+    distance = np.sqrt(np.sum((x - centre) ** 2, axis=1))
+    return np.nonzero(distance <= radius)[0]
+
+
+def test_uniform_grid_query():
+    dx = 2.5e-3
+    x = build_particle_coordinates(dx, 50, 25)
+    horizon = np.pi * dx
+    grid = UniformGrid(x, horizon)
+
+    centre = np.array([0.06, 0.03])
+    family = grid.query(centre, horizon)
+
+    assert np.array_equal(family, brute_force_query(x, centre, horizon))
+
+
+def test_uniform_grid_query_radius_larger_than_cell():
+    dx = 2.5e-3
+    x = build_particle_coordinates(dx, 50, 25)
+    grid = UniformGrid(x, np.pi * dx)
+
+    centre = np.array([0.06, 0.03])
+    radius = 10 * dx
+    family = grid.query(centre, radius)
+
+    assert np.array_equal(family, brute_force_query(x, centre, radius))
+
+
+def test_uniform_grid_query_outside_domain():
+    dx = 2.5e-3
+    x = build_particle_coordinates(dx, 50, 25)
+    grid = UniformGrid(x, np.pi * dx)
+
+    family = grid.query(np.array([1.0, 1.0]), np.pi * dx)
+
+    assert len(family) == 0
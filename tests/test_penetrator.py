@@ -0,0 +1,102 @@
+import numpy as np
+
+import pypd
+from pypd.tools import pairwise_norm
+
+
+def build_particle_coordinates(dx, n_div_x, n_div_y):
+    particle_coordinates = np.zeros([n_div_x * n_div_y, 2])
+    counter = 0
+
+    for i_y in range(n_div_y):
+        for i_x in range(n_div_x):
+            coord_x = dx * i_x
+            coord_y = dx * i_y
+            particle_coordinates[counter, 0] = coord_x
+            particle_coordinates[counter, 1] = coord_y
+            counter += 1
+
+    return particle_coordinates
+
+
+def build_particles(dx=2.5e-3, n_div_x=40, n_div_y=12):
+    x = build_particle_coordinates(dx, n_div_x, n_div_y)
+    material = pypd.Material(
+        name="quasi-brittle", E=37e9, Gf=143.2, density=2346, ft=3.9e6
+    )
+    bc = pypd.BoundaryConditions(
+        np.zeros_like(x, dtype=int), np.zeros_like(x), magnitude=0
+    )
+    return pypd.ParticleSet(x, dx, bc, material)
+
+
+def test_build_family_overlapping_configuration():
+    """
+    Regression test - a penetrator whose search radius overlaps the
+    particle grid must return a non-empty family that matches a brute
+    force distance check (a broken distance computation would silently
+    return an empty or wrong family)
+    """
+    particles = build_particles()
+    radius = 12.5e-3
+    penetrator = pypd.Penetrator(
+        np.array([0.05, 0.015]),
+        np.array([0, 1]),
+        np.array([0, -4e-4]),
+        radius,
+        particles,
+    )
+
+    assert len(penetrator.family) > 0
+
+    distance = pairwise_norm(particles.x - penetrator.centre)
+    expected = np.nonzero(distance <= penetrator.search_radius)[0]
+    assert np.array_equal(penetrator.family, expected)
+
+
+def test_build_family_outside_configuration():
+    particles = build_particles()
+    penetrator = pypd.Penetrator(
+        np.array([10.0, 10.0]),
+        np.array([0, 0]),
+        np.array([0, 0]),
+        12.5e-3,
+        particles,
+    )
+
+    assert len(penetrator.family) == 0
+
+
+def test_calculate_penetrator_force_two_particle_toy():
+    """
+    Regression test - drive the full penetrator path (position update and
+    contact force) on a two-particle toy. A broken or shadowed
+    update_penetrator_position would raise or leave the contacted
+    particle unmoved
+    """
+    dx = 1e-3
+    x = np.array([[0.0, 0.0], [0.0, dx]])
+    material = pypd.Material(
+        name="quasi-brittle", E=37e9, Gf=143.2, density=2346, ft=3.9e6
+    )
+    bc = pypd.BoundaryConditions(
+        np.zeros_like(x, dtype=int), np.zeros_like(x), magnitude=0
+    )
+    particles = pypd.ParticleSet(x, dx, bc, material)
+    simulation = pypd.Simulation(n_time_steps=10, damping=0, dt=1e-7)
+
+    radius = 5 * dx
+    penetrator = pypd.Penetrator(
+        np.array([0.0, dx + radius - (0.25 * dx)]),
+        np.array([0, 1]),
+        np.array([0, 0]),
+        radius,
+        particles,
+    )
+
+    penetrator.calculate_penetrator_force(particles, simulation, 0)
+
+    assert len(penetrator.penetrator_force_history) == 1
+    # the particle inside the penetrator is pushed down to its surface
+    assert np.isclose(particles.u[1, 1], -0.25 * dx)
+    assert penetrator.penetrator_force_history[0][1] != 0